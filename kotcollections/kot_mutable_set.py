@@ -4,9 +4,10 @@ KotMutableSet: A Python implementation of Kotlin's MutableSet interface with sna
 
 from __future__ import annotations
 
-from typing import TypeVar, Set, List, Iterator, Optional, Callable, Type, TYPE_CHECKING, Dict, Tuple
+from typing import TypeVar, Set, List, Iterator, Iterable, Optional, Callable, Type, TYPE_CHECKING, Dict, Tuple
 
 from kotcollections.kot_set import KotSet
+from kotcollections.type_checker import TypeChecker
 
 if TYPE_CHECKING:
     from kotcollections.kot_list import KotList
@@ -23,6 +24,8 @@ class KotMutableSet(KotSet[T]):
     Kotlin MutableSet functionality with snake_case naming.
     """
 
+    _backing_type: type = set
+
     def __init__(self, elements: Optional[Set[T] | List[T] | Iterator[T]] = None):
         """Initialize a KotMutableSet with optional elements.
         
@@ -47,23 +50,9 @@ class KotMutableSet(KotSet[T]):
                     self._element_type = element_type
                 else:
                     self._element_type = None
-                self._elements = set()
                 # Now process elements with the correct type set
-                if elements is not None:
-                    if hasattr(elements, '_elements') and hasattr(elements, 'to_list'):
-                        # It's a KotList or KotMutableList
-                        for element in elements:
-                            self._add_with_type_check(element)
-                    elif isinstance(elements, set):
-                        for element in elements:
-                            self._add_with_type_check(element)
-                    elif isinstance(elements, list):
-                        for element in elements:
-                            self._add_with_type_check(element)
-                    else:  # Iterator
-                        for element in elements:
-                            self._add_with_type_check(element)
-        
+                self._elements = self._build_elements(elements)
+
         # Set a meaningful name for debugging (handle cases where __name__ might not exist)
         type_name = getattr(element_type, '__name__', str(element_type))
         TypedKotMutableSet.__name__ = f"{cls.__name__}[{type_name}]"
@@ -108,6 +97,57 @@ class KotMutableSet(KotSet[T]):
         typed_class = cls[element_type]
         return typed_class(elements)
 
+    @classmethod
+    def _from_validated(cls, source: KotSet[T]) -> 'KotMutableSet[T]':
+        """Create a KotMutableSet copying an already type-checked KotSet.
+
+        The elements of `source` were validated when it was built, so they are
+        copied with their element type instead of being re-checked one by one.
+        """
+        mutable_set = cls.__new__(cls)
+        mutable_set._elements = set(source._elements)
+        mutable_set._element_type = source._element_type
+        return mutable_set
+
+    def _add_with_type_check(self, element: T) -> None:
+        """Add an element with type checking.
+
+        This method performs runtime type checking to ensure type safety.
+        It uses the TypeChecker utility for consistent validation across all collections.
+        """
+        # Handle type inference for first element
+        if self._element_type is None and element is not None:
+            self._element_type = TypeChecker.infer_element_type(element, KotSet)
+
+        # Skip type checking if not needed
+        if TypeChecker.should_skip_type_checking(self._element_type):
+            self._elements.add(element)
+            return
+
+        # Validate element type (None elements may be allowed)
+        if element is not None:
+            TypeChecker.validate_element(element, self._element_type, "KotSet")
+
+        self._elements.add(element)
+
+    def _add_all_with_type_check(self, elements: Iterable[T]) -> None:
+        """Add several elements with type checking.
+
+        Once the element type is known, all new elements are validated before any
+        of them is added, and elements whose class is exactly the element type skip
+        the full TypeChecker validation.
+        """
+        new_elements = [element for element in elements if element not in self._elements]
+
+        # Fall back to per-element adds while the type still has to be inferred
+        if TypeChecker.should_skip_type_checking(self._element_type):
+            for element in new_elements:
+                self._add_with_type_check(element)
+            return
+
+        self._validate_elements(new_elements)
+        self._elements.update(new_elements)
+
     # Mutation operations
 
     def add(self, element: T) -> bool:
@@ -123,22 +163,23 @@ class KotMutableSet(KotSet[T]):
 
     def add_all(self, elements: Set[T] | List[T] | 'KotSet[T]' | 'KotList[T]' | 'KotMutableList[T]') -> bool:
         """Adds all of the elements in the specified collection to this set.
-        
+
+        KotList and KotMutableList arguments are read through their backing list
+        without taking a copy, so callers must not mutate them during the call.
+
         Returns:
             true if any of the specified elements was added to the set.
         """
         if isinstance(elements, KotSet):
             elements = elements._elements
         elif hasattr(elements, '_elements') and hasattr(elements, 'to_list'):
-            # It's a KotList or KotMutableList
-            elements = set(elements)
+            # It's a KotList or KotMutableList; read its backing list directly
+            elements = elements._elements
         elif isinstance(elements, list):
             elements = set(elements)
 
         initial_size = self.size
-        for element in elements:
-            if element not in self._elements:
-                self._add_with_type_check(element)
+        self._add_all_with_type_check(elements)
         return self.size > initial_size
 
     def remove(self, element: T) -> bool:
@@ -163,8 +204,8 @@ class KotMutableSet(KotSet[T]):
         if isinstance(elements, KotSet):
             elements = elements._elements
         elif hasattr(elements, '_elements') and hasattr(elements, 'to_list'):
-            # It's a KotList or KotMutableList
-            elements = set(elements)
+            # It's a KotList or KotMutableList; read its backing list directly
+            elements = elements._elements
         elif isinstance(elements, list):
             elements = set(elements)
 
@@ -183,8 +224,8 @@ class KotMutableSet(KotSet[T]):
         if isinstance(elements, KotSet):
             elements = elements._elements
         elif hasattr(elements, '_elements') and hasattr(elements, 'to_list'):
-            # It's a KotList or KotMutableList
-            elements = set(elements)
+            # It's a KotList or KotMutableList; read its backing list directly
+            elements = elements._elements
         elif isinstance(elements, list):
             elements = set(elements)
 
@@ -238,19 +279,17 @@ class KotMutableSet(KotSet[T]):
         if isinstance(other, KotSet):
             other = other._elements
         elif hasattr(other, '_elements') and hasattr(other, 'to_list'):
-            # It's a KotList or KotMutableList
-            other = set(other)
-        for element in other:
-            if element not in self._elements:
-                self._add_with_type_check(element)
+            # It's a KotList or KotMutableList; read its backing list directly
+            other = other._elements
+        self._add_all_with_type_check(other)
 
     def intersect_update(self, other: Set[T] | 'KotSet[T]' | 'KotList[T]' | 'KotMutableList[T]') -> None:
         """Retains only elements that are contained in the specified collection."""
         if isinstance(other, KotSet):
             other = other._elements
         elif hasattr(other, '_elements') and hasattr(other, 'to_list'):
-            # It's a KotList or KotMutableList
-            other = set(other)
+            # It's a KotList or KotMutableList; read its backing list directly
+            other = other._elements
         self._elements.intersection_update(other)
         if self.is_empty():
             self._element_type = None
@@ -260,8 +299,8 @@ class KotMutableSet(KotSet[T]):
         if isinstance(other, KotSet):
             other = other._elements
         elif hasattr(other, '_elements') and hasattr(other, 'to_list'):
-            # It's a KotList or KotMutableList
-            other = set(other)
+            # It's a KotList or KotMutableList; read its backing list directly
+            other = other._elements
         self._elements.difference_update(other)
         if self.is_empty():
             self._element_type = None
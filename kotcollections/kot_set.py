@@ -6,7 +6,8 @@ from __future__ import annotations
 
 from collections import defaultdict
 from functools import reduce
-from typing import TypeVar, Generic, Callable, Optional, Set, Iterator, Any, Tuple, List, Type, TYPE_CHECKING, Dict
+from itertools import chain, starmap
+from typing import TypeVar, Generic, Callable, Optional, Set, AbstractSet, Iterator, Iterable, Any, Tuple, List, Type, TYPE_CHECKING, Dict
 
 from kotcollections.type_checker import TypeChecker
 
@@ -28,30 +29,17 @@ class KotSet(Generic[T]):
     maintaining type safety and immutability.
     """
 
+    # A KotSet never changes after construction, so its elements live in a frozenset
+    _backing_type: type = frozenset
+
     def __init__(self, elements: Optional[Set[T] | List[T] | Iterator[T] | 'KotList[T]' | 'KotMutableList[T]'] = None):
         """Initialize a KotSet with optional elements.
         
         Args:
             elements: Initial elements for the set (set, list, iterator, KotList, or KotMutableList)
         """
-        self._elements: Set[T] = set()
         self._element_type: Optional[type] = None
-
-        if elements is not None:
-            # Check for KotList/KotMutableList first to avoid circular imports
-            if hasattr(elements, '_elements') and hasattr(elements, 'to_list'):
-                # It's a KotList or KotMutableList
-                for element in elements:
-                    self._add_with_type_check(element)
-            elif isinstance(elements, set):
-                for element in elements:
-                    self._add_with_type_check(element)
-            elif isinstance(elements, list):
-                for element in elements:
-                    self._add_with_type_check(element)
-            else:  # Iterator
-                for element in elements:
-                    self._add_with_type_check(element)
+        self._elements: AbstractSet[T] = self._build_elements(elements)
 
     @classmethod
     def __class_getitem__(cls, element_type: Type[T]) -> Type['KotSet[T]']:
@@ -69,22 +57,8 @@ class KotSet(Generic[T]):
                     self._element_type = element_type
                 else:
                     self._element_type = None
-                self._elements = set()
                 # Now process elements with the correct type set
-                if elements is not None:
-                    if hasattr(elements, '_elements') and hasattr(elements, 'to_list'):
-                        # It's a KotList or KotMutableList
-                        for element in elements:
-                            self._add_with_type_check(element)
-                    elif isinstance(elements, set):
-                        for element in elements:
-                            self._add_with_type_check(element)
-                    elif isinstance(elements, list):
-                        for element in elements:
-                            self._add_with_type_check(element)
-                    else:  # Iterator
-                        for element in elements:
-                            self._add_with_type_check(element)
+                self._elements = self._build_elements(elements)
 
         # Set a meaningful name for debugging (handle cases where __name__ might not exist)
         type_name = getattr(element_type, '__name__', str(element_type))
@@ -132,26 +106,54 @@ class KotSet(Generic[T]):
         typed_class = cls[element_type]
         return typed_class(elements)
 
-    def _add_with_type_check(self, element: T) -> None:
-        """Add an element with type checking.
+    @classmethod
+    def _from_validated_set(cls, elements: AbstractSet[T], element_type: Optional[type]) -> 'KotSet[T]':
+        """Create a KotSet from an already type-checked set.
 
-        This method performs runtime type checking to ensure type safety.
-        It uses the TypeChecker utility for consistent validation across all collections.
+        Used by set operations whose results only hold elements that were validated
+        against `element_type` already, so they are not checked again one by one. A
+        frozenset is used as is; any other set is copied into one. An empty result
+        gets no element type, as if it had been built with KotSet().
         """
-        # Handle type inference for first element
-        if self._element_type is None and element is not None:
-            self._element_type = TypeChecker.infer_element_type(element, KotSet)
-
-        # Skip type checking if not needed
-        if TypeChecker.should_skip_type_checking(self._element_type):
-            self._elements.add(element)
-            return
+        kot_set = cls.__new__(cls)
+        kot_set._elements = cls._backing_type(elements)
+        kot_set._element_type = element_type if elements else None
+        return kot_set
 
-        # Validate element type (None elements may be allowed)
-        if element is not None:
-            TypeChecker.validate_element(element, self._element_type, "KotSet")
+    def _build_elements(self, elements: Optional[Iterable[T]]) -> AbstractSet[T]:
+        """Type-check the initial elements, then build the backing set from them once.
 
-        self._elements.add(element)
+        The element type is inferred from the first non-None element unless it is
+        already set.
+        """
+        if elements is None:
+            return self._backing_type()
+        if hasattr(elements, '_elements') and hasattr(elements, 'to_list'):
+            # It's a Kot collection; read its backing container directly
+            elements = elements._elements
+        elif not isinstance(elements, (set, frozenset, list)):
+            # Iterators can only be walked once, so keep what they yield
+            elements = list(elements)
+
+        if self._element_type is None:
+            for element in elements:
+                if element is not None:
+                    self._element_type = TypeChecker.infer_element_type(element, KotSet)
+                    break
+        if not TypeChecker.should_skip_type_checking(self._element_type):
+            self._validate_elements(elements)
+        return self._backing_type(elements)
+
+    def _validate_elements(self, elements: Iterable[T]) -> None:
+        """Validate elements against the element type, which must already be known.
+
+        Elements whose class is exactly the element type skip the full TypeChecker
+        validation, and None elements are always allowed.
+        """
+        element_type = self._element_type
+        for element in elements:
+            if element is not None and element.__class__ is not element_type:
+                TypeChecker.validate_element(element, element_type, "KotSet")
 
     # Basic Set operations
 
@@ -177,11 +179,13 @@ class KotSet(Generic[T]):
         if isinstance(elements, KotSet):
             elements = elements._elements
         elif hasattr(elements, '_elements') and hasattr(elements, 'to_list'):
-            # It's a KotList or KotMutableList
-            elements = set(elements)
-        elif isinstance(elements, list):
-            elements = set(elements)
-        return elements.issubset(self._elements)
+            # It's a KotList or KotMutableList; read its backing list directly
+            elements = elements._elements
+        # A larger set cannot be a subset; otherwise let set.issuperset probe
+        # our hash table for each element without building an intermediate set
+        if isinstance(elements, (set, frozenset)) and len(elements) > len(self._elements):
+            return False
+        return self._elements.issuperset(elements)
 
     # Access operations
 
@@ -300,19 +304,9 @@ class KotSet(Generic[T]):
     ) -> 'KotList[R]':
         """Returns a single list of all elements from results of transform function."""
         from kotcollections.kot_list import KotList
-        result = []
-        for element in self._elements:
-            transformed = transform(element)
-            if isinstance(transformed, KotSet):
-                result.extend(transformed._elements)
-            elif hasattr(transformed, '_elements') and hasattr(transformed, 'to_list'):
-                # It's a KotList or KotMutableList
-                result.extend(transformed)
-            elif isinstance(transformed, set):
-                result.extend(transformed)
-            else:  # List
-                result.extend(transformed)
-        return KotList(result)
+        # Kot collections iterate their backing containers, so chain can flatten every
+        # kind of result in C; duplicates are kept, as in Kotlin's flatMap
+        return KotList(chain.from_iterable(map(transform, self._elements)))
 
     def map_indexed(self, transform: Callable[[int, T], R]) -> 'KotList[R]':
         """Returns a list containing the results of applying the given transform function to each element and its index."""
@@ -325,19 +319,7 @@ class KotSet(Generic[T]):
     ) -> 'KotList[R]':
         """Returns a single list of all elements from results of transform function applied to each element and its index."""
         from kotcollections.kot_list import KotList
-        result = []
-        for index, element in enumerate(self._elements):
-            transformed = transform(index, element)
-            if isinstance(transformed, KotSet):
-                result.extend(transformed._elements)
-            elif hasattr(transformed, '_elements') and hasattr(transformed, 'to_list'):
-                # It's a KotList or KotMutableList
-                result.extend(transformed)
-            elif isinstance(transformed, set):
-                result.extend(transformed)
-            else:  # List
-                result.extend(transformed)
-        return KotList(result)
+        return KotList(chain.from_iterable(starmap(transform, enumerate(self._elements))))
 
     # Filtering operations
 
@@ -525,7 +507,11 @@ class KotSet(Generic[T]):
                 true_elements.append(element)
             else:
                 false_elements.append(element)
-        return KotSet(true_elements), KotSet(false_elements)
+        # Both halves only hold elements of this set, so they keep our type
+        return (
+            KotSet._from_validated_set(frozenset(true_elements), self._element_type),
+            KotSet._from_validated_set(frozenset(false_elements), self._element_type)
+        )
 
     def for_each(self, action: Callable[[T], None]) -> None:
         """Performs the given action on each element."""
@@ -543,14 +529,11 @@ class KotSet(Generic[T]):
 
     def zip(self, other: Set[R] | List[R] | 'KotSet[R]' | 'KotList[R]' | 'KotMutableList[R]') -> 'KotSet[Tuple[T, R]]':
         """Returns a set of pairs built from the elements of this set and other collection with the same index."""
-        if isinstance(other, KotSet):
-            other = list(other._elements)
-        elif hasattr(other, '_elements') and hasattr(other, 'to_list'):
-            # It's a KotList or KotMutableList
-            other = list(other)
-        elif isinstance(other, set):
-            other = list(other)
-        return KotSet(zip(self._elements, other))
+        if isinstance(other, KotSet) or (hasattr(other, '_elements') and hasattr(other, 'to_list')):
+            # Read the backing container of a KotSet, KotList or KotMutableList directly
+            other = other._elements
+        # zip stops at the shorter side, and every pair it builds is a tuple
+        return KotSet._from_validated_set(frozenset(zip(self._elements, other)), tuple)
 
     def as_sequence(self) -> Iterator[T]:
         """Creates a sequence instance that wraps the original set, allowing lazy evaluation."""
@@ -560,38 +543,78 @@ class KotSet(Generic[T]):
 
     def union(self, other: Set[T] | 'KotSet[T]' | 'KotList[T]' | 'KotMutableList[T]') -> 'KotSet[T]':
         """Returns a set containing all distinct elements from both collections."""
+        other_type = None
         if isinstance(other, KotSet):
+            if not self._elements and self._element_type is None and isinstance(other._elements, frozenset):
+                # Nothing of ours to add, and the other set is immutable
+                return other
+            other_type = other._element_type
             other = other._elements
         elif hasattr(other, '_elements') and hasattr(other, 'to_list'):
-            # It's a KotList or KotMutableList
-            other = set(other)
-        return KotSet(self._elements.union(other))
+            # It's a KotList, KotMutableList or KotMap; read its backing container directly
+            other_type = getattr(other, '_element_type', None)
+            other = other._elements
+
+        if not other and isinstance(self._elements, frozenset):
+            # Nothing to add, and this set is immutable
+            return self
+
+        element_type = self._element_type
+        if TypeChecker.should_skip_type_checking(element_type):
+            # No type to check against yet; infer it like the constructor does
+            return KotSet(self._elements.union(other))
+
+        # A Kot collection was validated against its own element type when it was
+        # built, so its elements only need checking if that type is not ours
+        if not (isinstance(other_type, type) and issubclass(other_type, element_type)):
+            if not isinstance(other, (set, frozenset, list)):
+                # Iterators would be exhausted by the check below
+                other = list(other)
+            self._validate_elements(element for element in other if element not in self._elements)
+        return KotSet._from_validated_set(self._elements.union(other), element_type)
 
     def intersect(self, other: Set[T] | 'KotSet[T]' | 'KotList[T]' | 'KotMutableList[T]') -> 'KotSet[T]':
         """Returns a set containing all elements that are contained by both collections."""
         if isinstance(other, KotSet):
             other = other._elements
         elif hasattr(other, '_elements') and hasattr(other, 'to_list'):
-            # It's a KotList or KotMutableList
+            # It's a KotList or KotMutableList; read its backing list directly
+            other = other._elements
+        if not self._elements or not other:
+            # Nothing can be contained by both collections
+            return KotSet()
+        if not isinstance(other, (set, frozenset, dict)):
             other = set(other)
-        return KotSet(self._elements.intersection(other))
+        # set.intersection would keep the other collection's copy of equal elements,
+        # which may be of another class, so take every element from this set instead
+        return KotSet._from_validated_set(
+            frozenset(element for element in self._elements if element in other), self._element_type
+        )
 
     def subtract(self, other: Set[T] | 'KotSet[T]' | 'KotList[T]' | 'KotMutableList[T]') -> 'KotSet[T]':
         """Returns a set containing all elements that are not contained in the specified collection."""
         if isinstance(other, KotSet):
             other = other._elements
         elif hasattr(other, '_elements') and hasattr(other, 'to_list'):
-            # It's a KotList or KotMutableList
-            other = set(other)
-        return KotSet(self._elements.difference(other))
+            # It's a KotList or KotMutableList; read its backing list directly
+            other = other._elements
+        if isinstance(self._elements, frozenset) and (not self._elements or not other):
+            # Nothing to remove, and this set is immutable
+            return self
+        # Every element of the result comes from this set, so it keeps our type
+        return KotSet._from_validated_set(self._elements.difference(other), self._element_type)
 
     # Operator-style set operations
 
     def plus(self, element: T) -> 'KotSet[T]':
         """Returns a set containing all elements of the original set and the given element."""
-        result = self._elements.copy()
-        result.add(element)
-        return KotSet(result)
+        element_type = self._element_type
+        if TypeChecker.should_skip_type_checking(element_type):
+            # No type to check against yet; infer it like the constructor does
+            return KotSet(self._elements.union((element,)))
+        if element not in self._elements:
+            self._validate_elements((element,))
+        return KotSet._from_validated_set(self._elements.union((element,)), element_type)
 
     def plus_collection(
         self,
@@ -602,9 +625,8 @@ class KotSet(Generic[T]):
 
     def minus(self, element: T) -> 'KotSet[T]':
         """Returns a set containing all elements of the original set except the given element."""
-        result = self._elements.copy()
-        result.discard(element)
-        return KotSet(result)
+        # Every remaining element comes from this set, so it keeps our type
+        return KotSet._from_validated_set(self._elements.difference((element,)), self._element_type)
 
     def minus_collection(
         self,
@@ -652,12 +674,11 @@ class KotSet(Generic[T]):
     def to_kot_mutable_set(self) -> 'KotMutableSet[T]':
         """Returns a KotMutableSet containing all elements."""
         from kotcollections.kot_mutable_set import KotMutableSet
-        # Preserve type information when converting
+        # Preserve type information when converting; the elements are already
+        # type-checked, so they are copied without being checked again
         if self._element_type is not None:
-            mutable_set = KotMutableSet.of_type(self._element_type, self._elements.copy())
-        else:
-            mutable_set = KotMutableSet(self._elements.copy())
-        return mutable_set
+            return KotMutableSet[self._element_type]._from_validated(self)
+        return KotMutableSet._from_validated(self)
 
     def to_sorted_set(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> KotSet[T]:
         """Returns a sorted list of all elements."""
@@ -2,13 +2,41 @@
 Unit tests for KotMutableSet class.
 """
 
+import operator
+import os
 import unittest
 
 from kotcollections.kot_list import KotList
 from kotcollections.kot_map import KotMap
+from kotcollections.kot_mutable_list import KotMutableList
 from kotcollections.kot_mutable_set import KotMutableSet
 from kotcollections.kot_set import KotSet
 
+_S_345 = frozenset((3, 4, 5))
+_S_34567 = frozenset((3, 4, 5, 6, 7))
+_KS_234 = KotSet([2, 3, 4])
+_KS_567 = KotSet([5, 6, 7])
+
+
+def _is_even(x):
+    return x % 2 == 0
+
+
+def _gt_zero(x):
+    return x > 0
+
+
+def _gt_ten(x):
+    return x > 10
+
+
+def _always_true(_):
+    return True
+
+
+def _always_false(_):
+    return False
+
 
 class TestKotMutableSetBasics(unittest.TestCase):
     """Test basic KotMutableSet functionality."""
@@ -24,27 +52,34 @@ class TestKotMutableSetBasics(unittest.TestCase):
         """Test creating KotMutableSet from a Python set."""
         s = KotMutableSet({1, 2, 3})
         self.assertFalse(s.is_empty())
-        self.assertEqual(s.size, 3)
-        self.assertTrue(1 in s)
-        self.assertTrue(2 in s)
-        self.assertTrue(3 in s)
+        self.assertEqual(set(s), {1, 2, 3})
 
     def test_init_from_list(self):
         """Test creating KotMutableSet from a list."""
         s = KotMutableSet([1, 2, 2, 3, 3, 3])
-        self.assertEqual(s.size, 3)  # Duplicates removed
-        self.assertTrue(1 in s)
-        self.assertTrue(2 in s)
-        self.assertTrue(3 in s)
+        self.assertEqual(set(s), {1, 2, 3})  # Duplicates removed
+
+    def test_len(self):
+        """Test len() and length hint track mutations."""
+        s = KotMutableSet([1, 2, 3])
+        self.assertEqual(len(s), 3)
+        self.assertEqual(operator.length_hint(s), 3)
+
+        s.add(4)
+        self.assertEqual(len(s), 4)
+        self.assertEqual(len(list(s)), 4)
+
+        s.clear()
+        self.assertEqual(len(s), 0)
 
     def test_repr(self):
         """Test string representation."""
         s = KotMutableSet([1, 2, 3])
         repr_str = repr(s)
         self.assertTrue(repr_str.startswith("KotMutableSet("))
-        self.assertTrue("1" in repr_str)
-        self.assertTrue("2" in repr_str)
-        self.assertTrue("3" in repr_str)
+        self.assertIn("1", repr_str)
+        self.assertIn("2", repr_str)
+        self.assertIn("3", repr_str)
 
     def test_inherits_from_kot_set(self):
         """Test that KotMutableSet inherits from KotSet."""
@@ -55,23 +90,26 @@ class TestKotMutableSetBasics(unittest.TestCase):
 class TestKotMutableSetMutations(unittest.TestCase):
     """Test KotMutableSet mutation operations."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._template = KotSet([1, 2, 3, 4, 5])
+        cls._template_six = KotSet([1, 2, 3, 4, 5, 6])
+
     def test_add(self):
         """Test add operation."""
         s = KotMutableSet()
 
         # Add to empty set
         self.assertTrue(s.add(1))
-        self.assertEqual(s.size, 1)
-        self.assertTrue(1 in s)
+        self.assertEqual(set(s), {1})
 
         # Add more elements
         self.assertTrue(s.add(2))
         self.assertTrue(s.add(3))
-        self.assertEqual(s.size, 3)
 
         # Try to add duplicate
         self.assertFalse(s.add(1))
-        self.assertEqual(s.size, 3)
+        self.assertEqual(set(s), {1, 2, 3})
 
     def test_add_type_safety(self):
         """Test add maintains type safety."""
@@ -85,93 +123,101 @@ class TestKotMutableSetMutations(unittest.TestCase):
         s = KotMutableSet([1, 2, 3])
 
         # Add from set
-        self.assertTrue(s.add_all({3, 4, 5}))
-        self.assertEqual(s.size, 5)
+        self.assertTrue(s.add_all(_S_345))
 
         # Add from list with no new elements
         self.assertFalse(s.add_all([1, 2, 3]))
-        self.assertEqual(s.size, 5)
 
         # Add from KotSet
-        other = KotSet([5, 6, 7])
+        other = _KS_567
         self.assertTrue(s.add_all(other))
-        self.assertEqual(s.size, 7)
+        self.assertEqual(set(s), {1, 2, 3, 4, 5, 6, 7})
+
+    def test_add_all_type_safety(self):
+        """Test add_all validates every element before adding any."""
+        s = KotMutableSet([1, 2, 3])
+
+        with self.assertRaises(TypeError):
+            s.add_all([4, "5", 6])
+        self.assertEqual(s.to_set(), {1, 2, 3})
+
+        # Subclass instances of the element type are still accepted
+        class Flag(int):
+            pass
+
+        flag = Flag(7)
+        self.assertTrue(s.add_all([flag, 4]))
+        self.assertEqual(s.to_set(), {1, 2, 3, 4, 7})
+        self.assertTrue(any(e is flag for e in s))
 
     def test_remove(self):
         """Test remove operation."""
-        s = KotMutableSet([1, 2, 3, 4, 5])
+        s = KotMutableSet._from_validated(self._template)
 
         # Remove existing element
         self.assertTrue(s.remove(3))
-        self.assertEqual(s.size, 4)
-        self.assertFalse(3 in s)
+        self.assertEqual(set(s), {1, 2, 4, 5})
 
         # Try to remove non-existing element
         self.assertFalse(s.remove(10))
-        self.assertEqual(s.size, 4)
 
         # Remove all elements
-        for i in [1, 2, 4, 5]:
+        for i in (1, 2, 4, 5):
             self.assertTrue(s.remove(i))
         self.assertTrue(s.is_empty())
 
     def test_remove_all(self):
         """Test remove_all operation."""
-        s = KotMutableSet([1, 2, 3, 4, 5])
+        s = KotMutableSet._from_validated(self._template)
+        to_remove = frozenset((2, 3, 4))
 
         # Remove multiple elements
-        self.assertTrue(s.remove_all({2, 3, 4}))
-        self.assertEqual(s.size, 2)
-        self.assertTrue(1 in s)
-        self.assertTrue(5 in s)
+        self.assertTrue(s.remove_all(to_remove))
+        self.assertEqual(set(s), {1, 5})
 
         # Try to remove non-existing elements
-        self.assertFalse(s.remove_all({10, 11, 12}))
-        self.assertEqual(s.size, 2)
+        self.assertFalse(s.remove_all(frozenset((10, 11, 12))))
 
         # Remove from list
         self.assertTrue(s.remove_all([1, 5]))
         self.assertTrue(s.is_empty())
 
         # Test with KotSet
-        s2 = KotMutableSet([1, 2, 3, 4, 5])
-        kot_set_to_remove = KotSet([2, 3, 4])
+        s2 = KotMutableSet._from_validated(self._template)
+        kot_set_to_remove = _KS_234
         self.assertTrue(s2.remove_all(kot_set_to_remove))
-        self.assertEqual(s2.size, 2)
+        self.assertEqual(set(s2), {1, 5})
 
     def test_retain_all(self):
         """Test retain_all operation."""
-        s = KotMutableSet([1, 2, 3, 4, 5])
+        s = KotMutableSet._from_validated(self._template)
+        to_keep = frozenset((2, 3, 4))
 
         # Retain subset
-        self.assertTrue(s.retain_all({2, 3, 4}))
-        self.assertEqual(s.size, 3)
-        self.assertFalse(1 in s)
-        self.assertFalse(5 in s)
+        self.assertTrue(s.retain_all(to_keep))
+        self.assertEqual(set(s), {2, 3, 4})
 
         # Retain with no changes
-        self.assertFalse(s.retain_all({2, 3, 4, 6, 7}))
-        self.assertEqual(s.size, 3)
+        self.assertFalse(s.retain_all(frozenset((2, 3, 4, 6, 7))))
 
         # Retain empty set
         self.assertTrue(s.retain_all(set()))
         self.assertTrue(s.is_empty())
 
         # Test with KotSet
-        s2 = KotMutableSet([1, 2, 3, 4, 5])
-        kot_set_to_retain = KotSet([2, 3, 4])
+        s2 = KotMutableSet._from_validated(self._template)
+        kot_set_to_retain = _KS_234
         self.assertTrue(s2.retain_all(kot_set_to_retain))
-        self.assertEqual(s2.size, 3)
+        self.assertEqual(set(s2), {2, 3, 4})
 
         # Test with list
-        s3 = KotMutableSet([1, 2, 3, 4, 5])
+        s3 = KotMutableSet._from_validated(self._template)
         self.assertTrue(s3.retain_all([1, 2, 3]))
-        self.assertEqual(s3.size, 3)
-        self.assertTrue(all(x in [1, 2, 3] for x in s3))
+        self.assertEqual(set(s3), {1, 2, 3})
 
     def test_clear(self):
         """Test clear operation."""
-        s = KotMutableSet([1, 2, 3, 4, 5])
+        s = KotMutableSet._from_validated(self._template)
         self.assertEqual(s.size, 5)
 
         s.clear()
@@ -184,65 +230,64 @@ class TestKotMutableSetMutations(unittest.TestCase):
 
     def test_remove_if(self):
         """Test remove_if operation."""
-        s = KotMutableSet([1, 2, 3, 4, 5, 6])
+        s = KotMutableSet._from_validated(self._template_six)
 
         # Remove even numbers
-        self.assertTrue(s.remove_if(lambda x: x % 2 == 0))
+        self.assertTrue(s.remove_if(_is_even))
         self.assertEqual(s.size, 3)
-        self.assertTrue(all(x % 2 == 1 for x in s))
+        self.assertLessEqual(set(s), {1, 3, 5})
 
         # Try to remove with no matches
-        self.assertFalse(s.remove_if(lambda x: x > 10))
+        self.assertFalse(s.remove_if(_gt_ten))
         self.assertEqual(s.size, 3)
 
         # Remove all
-        self.assertTrue(s.remove_if(lambda x: True))
+        self.assertTrue(s.remove_if(_always_true))
         self.assertTrue(s.is_empty())
 
     def test_retain_if(self):
         """Test retain_if operation."""
-        s = KotMutableSet([1, 2, 3, 4, 5, 6])
+        s = KotMutableSet._from_validated(self._template_six)
 
         # Retain even numbers
-        self.assertTrue(s.retain_if(lambda x: x % 2 == 0))
+        self.assertTrue(s.retain_if(_is_even))
         self.assertEqual(s.size, 3)
-        self.assertTrue(all(x % 2 == 0 for x in s))
+        self.assertLessEqual(set(s), {2, 4, 6})
 
         # Retain all (no change)
-        self.assertFalse(s.retain_if(lambda x: x > 0))
+        self.assertFalse(s.retain_if(_gt_zero))
         self.assertEqual(s.size, 3)
 
         # Retain none
-        self.assertTrue(s.retain_if(lambda x: False))
+        self.assertTrue(s.retain_if(_always_false))
         self.assertTrue(s.is_empty())
 
 
 class TestKotMutableSetSetOperations(unittest.TestCase):
     """Test KotMutableSet set operations with mutation."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._template = KotSet([1, 2, 3, 4, 5])
+
     def test_union_update(self):
         """Test union_update operation."""
         s = KotMutableSet([1, 2, 3])
-        s.union_update({3, 4, 5})
+        s.union_update(_S_345)
 
-        self.assertEqual(s.size, 5)
-        for i in range(1, 6):
-            self.assertTrue(i in s)
+        self.assertEqual(set(s), {1, 2, 3, 4, 5})
 
         # Union with KotSet
-        other = KotSet([5, 6, 7])
+        other = _KS_567
         s.union_update(other)
         self.assertEqual(s.size, 7)
 
     def test_intersect_update(self):
         """Test intersect_update operation."""
-        s = KotMutableSet([1, 2, 3, 4, 5])
-        s.intersect_update({3, 4, 5, 6, 7})
+        s = KotMutableSet._from_validated(self._template)
+        s.intersect_update(_S_34567)
 
-        self.assertEqual(s.size, 3)
-        self.assertTrue(3 in s)
-        self.assertTrue(4 in s)
-        self.assertTrue(5 in s)
+        self.assertEqual(set(s), {3, 4, 5})
 
         # Intersect with empty
         s.intersect_update(set())
@@ -250,29 +295,29 @@ class TestKotMutableSetSetOperations(unittest.TestCase):
 
     def test_subtract_update(self):
         """Test subtract_update operation."""
-        s = KotMutableSet([1, 2, 3, 4, 5])
-        s.subtract_update({3, 4, 5, 6, 7})
+        s = KotMutableSet._from_validated(self._template)
+        s.subtract_update(_S_34567)
 
-        self.assertEqual(s.size, 2)
-        self.assertTrue(1 in s)
-        self.assertTrue(2 in s)
+        self.assertEqual(set(s), {1, 2})
 
         # Subtract all
-        s.subtract_update({1, 2})
+        s.subtract_update(frozenset((1, 2)))
         self.assertTrue(s.is_empty())
 
 
 class TestKotMutableSetOperators(unittest.TestCase):
     """Test KotMutableSet operator overloads."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._template = KotSet([1, 2, 3, 4, 5])
+
     def test_iadd_operator(self):
         """Test += operator (union update)."""
         s = KotMutableSet([1, 2, 3])
-        s += {3, 4, 5}
+        s += _S_345
 
-        self.assertEqual(s.size, 5)
-        for i in range(1, 6):
-            self.assertTrue(i in s)
+        self.assertEqual(set(s), {1, 2, 3, 4, 5})
 
         # Chain operations
         s += KotSet([6, 7])
@@ -280,28 +325,21 @@ class TestKotMutableSetOperators(unittest.TestCase):
 
     def test_isub_operator(self):
         """Test -= operator (subtract update)."""
-        s = KotMutableSet([1, 2, 3, 4, 5])
-        s -= {3, 4}
+        s = KotMutableSet._from_validated(self._template)
+        s -= frozenset((3, 4))
 
-        self.assertEqual(s.size, 3)
-        self.assertTrue(1 in s)
-        self.assertTrue(2 in s)
-        self.assertTrue(5 in s)
+        self.assertEqual(set(s), {1, 2, 5})
 
         # Chain operations
         s -= KotSet([1, 5])
-        self.assertEqual(s.size, 1)
-        self.assertTrue(2 in s)
+        self.assertEqual(set(s), {2})
 
     def test_iand_operator(self):
         """Test &= operator (intersect update)."""
-        s = KotMutableSet([1, 2, 3, 4, 5])
-        s &= {3, 4, 5, 6, 7}
+        s = KotMutableSet._from_validated(self._template)
+        s &= _S_34567
 
-        self.assertEqual(s.size, 3)
-        self.assertTrue(3 in s)
-        self.assertTrue(4 in s)
-        self.assertTrue(5 in s)
+        self.assertEqual(set(s), {3, 4, 5})
 
         # Chain operations
         s &= KotSet([4, 5])
@@ -321,23 +359,38 @@ class TestKotMutableSetConversion(unittest.TestCase):
         self.assertNotIsInstance(s, KotMutableSet)
 
         # Check contents are copied
-        self.assertEqual(s.size, 3)
-        self.assertTrue(1 in s)
-        self.assertTrue(2 in s)
-        self.assertTrue(3 in s)
+        self.assertEqual(set(s), {1, 2, 3})
 
         # Ensure it's a copy
         ms.add(4)
         self.assertEqual(ms.size, 4)
         self.assertEqual(s.size, 3)
 
+    def test_from_validated(self):
+        """Test building a KotMutableSet from an already validated KotSet."""
+        source = KotSet([1, 2, 3])
+        ms = KotMutableSet._from_validated(source)
+
+        self.assertIsInstance(ms, KotMutableSet)
+        self.assertEqual(ms.to_set(), {1, 2, 3})
+        self.assertEqual(ms._element_type, int)
+
+        # Ensure it's a copy that still enforces the element type
+        ms.add(4)
+        self.assertEqual(source.size, 3)
+        with self.assertRaises(TypeError):
+            ms.add("5")
+
 
 class TestKotMutableSetTypeManagement(unittest.TestCase):
     """Test type management during mutations."""
 
+    def setUp(self):
+        self.s = KotMutableSet([1, 2, 3])
+
     def test_type_reset_on_clear(self):
         """Test that type is reset when set is cleared."""
-        s = KotMutableSet([1, 2, 3])
+        s = self.s
         s.clear()
 
         # Should be able to add strings now
@@ -347,7 +400,7 @@ class TestKotMutableSetTypeManagement(unittest.TestCase):
 
     def test_type_reset_on_remove_all(self):
         """Test that type is reset when all elements are removed."""
-        s = KotMutableSet([1, 2, 3])
+        s = self.s
         s.remove_all([1, 2, 3])
 
         # Should be able to add strings now
@@ -356,7 +409,7 @@ class TestKotMutableSetTypeManagement(unittest.TestCase):
 
     def test_type_preserved_partial_remove(self):
         """Test that type is preserved when some elements remain."""
-        s = KotMutableSet([1, 2, 3])
+        s = self.s
         s.remove(1)
 
         # Should still enforce integer type
@@ -368,106 +421,39 @@ class TestKotMutableSetTypeManagement(unittest.TestCase):
         self.assertEqual(s.size, 3)
 
 
+@unittest.skipIf(os.environ.get('KOT_SKIP_INTEGRATION') == '1', 'integration tests skipped')
 class TestKotMutableSetWithKotList(unittest.TestCase):
     """Test KotMutableSet accepting KotList and KotMutableList."""
 
     def test_init_from_kot_list(self):
         """Test creating KotMutableSet from KotList."""
-        from kotcollections.kot_list import KotList
-
         kot_list = KotList([1, 2, 2, 3, 3, 3])
         s = KotMutableSet(kot_list)
-        self.assertEqual(s.size, 3)  # Duplicates removed
-        self.assertTrue(1 in s)
-        self.assertTrue(2 in s)
-        self.assertTrue(3 in s)
+        self.assertEqual(set(s), {1, 2, 3})  # Duplicates removed
 
         # Test mutation after creation
         self.assertTrue(s.add(4))
         self.assertEqual(s.size, 4)
 
-    def test_add_all_with_kot_list(self):
-        """Test add_all with KotList."""
-        from kotcollections.kot_list import KotList
-
-        s = KotMutableSet([1, 2])
-        kot_list = KotList([2, 3, 4])
-        self.assertTrue(s.add_all(kot_list))
-        self.assertEqual(s.size, 4)
-        self.assertTrue(3 in s)
-        self.assertTrue(4 in s)
-
-        # Test with KotMutableList
-        from kotcollections.kot_mutable_list import KotMutableList
-        kot_mutable_list = KotMutableList([4, 5, 6])
-        self.assertTrue(s.add_all(kot_mutable_list))
-        self.assertEqual(s.size, 6)
-
-    def test_remove_all_with_kot_list(self):
-        """Test remove_all with KotList."""
-        from kotcollections.kot_list import KotList
-
-        s = KotMutableSet([1, 2, 3, 4, 5])
-        kot_list = KotList([2, 3, 4])
-        self.assertTrue(s.remove_all(kot_list))
-        self.assertEqual(s.size, 2)
-        self.assertTrue(1 in s)
-        self.assertTrue(5 in s)
-
-    def test_retain_all_with_kot_list(self):
-        """Test retain_all with KotList."""
-        from kotcollections.kot_list import KotList
-
-        s = KotMutableSet([1, 2, 3, 4, 5])
-        kot_list = KotList([2, 3, 4, 6])
-        self.assertTrue(s.retain_all(kot_list))
-        self.assertEqual(s.size, 3)
-        self.assertTrue(2 in s)
-        self.assertTrue(3 in s)
-        self.assertTrue(4 in s)
-
-    def test_union_update_with_kot_list(self):
-        """Test union_update with KotList."""
-        from kotcollections.kot_list import KotList
-
-        s = KotMutableSet([1, 2, 3])
-        kot_list = KotList([3, 4, 5, 5])
-        s.union_update(kot_list)
-
-        self.assertEqual(s.size, 5)
-        for i in range(1, 6):
-            self.assertTrue(i in s)
-
-    def test_intersect_update_with_kot_list(self):
-        """Test intersect_update with KotList."""
-        from kotcollections.kot_list import KotList
-
-        s = KotMutableSet([1, 2, 3, 4, 5])
-        kot_list = KotList([3, 4, 5, 6, 7])
-        s.intersect_update(kot_list)
-
-        self.assertEqual(s.size, 3)
-        self.assertTrue(3 in s)
-        self.assertTrue(4 in s)
-        self.assertTrue(5 in s)
-
-    def test_subtract_update_with_kot_list(self):
-        """Test subtract_update with KotList."""
-        from kotcollections.kot_list import KotList
-
-        s = KotMutableSet([1, 2, 3, 4, 5])
-        kot_list = KotList([3, 4, 5])
-        s.subtract_update(kot_list)
-
-        self.assertEqual(s.size, 2)
-        self.assertTrue(1 in s)
-        self.assertTrue(2 in s)
+    def test_bulk_operations_with_kot_list(self):
+        """Test bulk operations with KotList and KotMutableList."""
+        cases = [
+            ('add_all', [1, 2], KotList([2, 3, 4]), True, {1, 2, 3, 4}),
+            ('add_all', [1, 2, 3, 4], KotMutableList([4, 5, 6]), True, {1, 2, 3, 4, 5, 6}),
+            ('remove_all', [1, 2, 3, 4, 5], KotList([2, 3, 4]), True, {1, 5}),
+            ('retain_all', [1, 2, 3, 4, 5], KotList([2, 3, 4, 6]), True, {2, 3, 4}),
+            ('union_update', [1, 2, 3], KotList([3, 4, 5, 5]), None, {1, 2, 3, 4, 5}),
+            ('intersect_update', [1, 2, 3, 4, 5], KotList([3, 4, 5, 6, 7]), None, {3, 4, 5}),
+            ('subtract_update', [1, 2, 3, 4, 5], KotList([3, 4, 5]), None, {1, 2}),
+        ]
+        for method, initial, other, expected_result, expected in cases:
+            with self.subTest(method=method, other=other):
+                s = KotMutableSet(initial)
+                self.assertIs(getattr(s, method)(other), expected_result)
+                self.assertEqual(set(s), expected)
 
     def test_operators_with_kot_list(self):
         """Test operators +=, -=, &= with KotList."""
-        from kotcollections.kot_list import KotList
-        from kotcollections.kot_mutable_list import KotMutableList
-
         # Test += operator
         s1 = KotMutableSet([1, 2, 3])
         kot_list1 = KotList([3, 4, 5])
@@ -478,18 +464,13 @@ class TestKotMutableSetWithKotList(unittest.TestCase):
         s2 = KotMutableSet([1, 2, 3, 4, 5])
         kot_list2 = KotMutableList([3, 4])
         s2 -= kot_list2
-        self.assertEqual(s2.size, 3)
-        self.assertTrue(1 in s2)
-        self.assertTrue(2 in s2)
-        self.assertTrue(5 in s2)
+        self.assertEqual(set(s2), {1, 2, 5})
 
         # Test &= operator
         s3 = KotMutableSet([1, 2, 3, 4, 5])
         kot_list3 = KotList([3, 4, 5, 6])
         s3 &= kot_list3
-        self.assertEqual(s3.size, 3)
-        for i in [3, 4, 5]:
-            self.assertTrue(i in s3)
+        self.assertEqual(set(s3), {3, 4, 5})
 
 
 class TestKotMutableSetInheritedTransformations(unittest.TestCase):